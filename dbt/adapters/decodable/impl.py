@@ -214,7 +214,8 @@ class DecodableAdapter(BaseAdapter):
             return
 
         # We need to first delete any pipelines that rely on this stream as their source
-        pipelines = client.list_pipelines().items
+        # Materialized up front, as the loop below may delete pipelines
+        pipelines = list(client.iter_pipelines())
         for pipeline in pipelines:
             pipe_id = pipeline["id"]
 
@@ -309,7 +310,8 @@ class DecodableAdapter(BaseAdapter):
 
         # Update the sql for any pipelines that had `from_relation` as an inbound stream
         renamed_sources: int = 0
-        pipelines = client.list_pipelines().items
+        # Materialized up front, so the SQL updates below can't shift the pages still to be fetched
+        pipelines = list(client.iter_pipelines())
         for pipeline in pipelines:
             pipe_id = pipeline["id"]
 
@@ -352,8 +354,7 @@ class DecodableAdapter(BaseAdapter):
     def list_relations_without_caching(self, schema_relation: BaseRelation) -> List[BaseRelation]:
         relations: List[BaseRelation] = []
 
-        stream_list: List[Dict[str, Any]] = self._control_plane_client().list_streams().items
-        for stream in stream_list:
+        for stream in self._control_plane_client().iter_streams():
             relations.append(
                 self.Relation.create(
                     database=schema_relation.database,
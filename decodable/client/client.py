@@ -16,7 +16,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, List
+from operator import itemgetter
+from typing import Any, Dict, Iterator, Optional, List
 
 import requests
 from typing_extensions import override
@@ -29,14 +30,22 @@ from decodable.config.client_config import (
 from decodable.client.schema import SchemaV2
 
 
+# Preview responses are polled repeatedly, so extract their fields in a single call
+_PREVIEW_RESPONSE_FIELDS = itemgetter("id", "output_stream_type", "results", "next_token")
+
+
 @dataclass
 class ApiResponse:
+    __slots__ = ("items", "next_page_token")
+
     items: List[Any]
     next_page_token: Optional[str]
 
 
 @dataclass
 class PreviewResponse:
+    __slots__ = ("id", "output_stream_type", "results", "next_token")
+
     id: str
     output_stream_type: str
     results: List[Dict[str, Any]]
@@ -44,16 +53,13 @@ class PreviewResponse:
 
     @classmethod
     def from_dict(cls, response: Dict[str, Any]) -> PreviewResponse:
-        return cls(
-            id=response["id"],
-            output_stream_type=response["output_stream_type"],
-            results=response["results"],
-            next_token=response["next_token"],
-        )
+        return cls(*_PREVIEW_RESPONSE_FIELDS(response))
 
 
 @dataclass
 class AccountInfoResponse:
+    __slots__ = ("subscription", "deployment_type", "data_plane_hostname", "uses_new_secrets")
+
     subscription: SubscriptionResponse
     deployment_type: str
     data_plane_hostname: str
@@ -71,6 +77,8 @@ class AccountInfoResponse:
 
 @dataclass
 class SubscriptionResponse:
+    __slots__ = ("plan_id", "capabilities")
+
     plan_id: str
     capabilities: List[str]
 
@@ -84,6 +92,8 @@ class SubscriptionResponse:
 
 @dataclass
 class PreviewTokensResponse:
+    __slots__ = ("data_plane_request", "post_token", "get_token")
+
     data_plane_request: str
     post_token: str
     get_token: str
@@ -99,6 +109,8 @@ class PreviewTokensResponse:
 
 @dataclass
 class DataPlaneTokenResponse:
+    __slots__ = ("data_plane_request", "token")
+
     data_plane_request: Optional[str]
     token: str
 
@@ -114,13 +126,17 @@ class DataPlaneTokenResponse:
 
 
 class DecodableAPIException(Exception):
+    def __init__(self, *args: Any):
+        super().__init__(*args)
+        self._message = f"Decodable: {self.category()}: {self.args[0] if self.args else ''}"
+
     @classmethod
     def category(cls) -> str:
         return "DecodableAPIException"
 
     @override
     def __str__(self) -> str:
-        return f"Decodable: {self.category()}: {self.args[0]}"
+        return self._message
 
 
 class InvalidRequest(DecodableAPIException):
@@ -141,7 +157,17 @@ class ResourceNotFound(DecodableAPIException):
         return "ResourceNotFound"
 
 
-def raise_api_exception(code: int, reason: str):
+def _error_body(response: requests.Response) -> Any:
+    # Error bodies are usually JSON, but proxies and gateways may answer with plain text or nothing
+    if not response.content:
+        return response.reason
+    try:
+        return response.json()
+    except ValueError:
+        return response.text
+
+
+def raise_api_exception(code: int, reason: Any):
     if code == 400:
         raise InvalidRequest(reason)
     elif code == 404:
@@ -157,6 +183,7 @@ class DecodableDataPlaneApiClient:
 
     def __init__(self, config: DecodableDataPlaneClientConfig):
         self.config = config
+        self._session = requests.Session()
 
     def start_preview(self, token: str, data_plane_request: str) -> PreviewResponse:
         response = self._post_api_request(
@@ -192,7 +219,7 @@ class DecodableDataPlaneApiClient:
         if additional_headers is not None:
             headers.update(additional_headers)
 
-        response = requests.get(
+        response = self._session.get(
             url=endpoint_url,
             headers=headers,
         )
@@ -200,12 +227,12 @@ class DecodableDataPlaneApiClient:
         if response.ok:
             return response
         else:
-            raise_api_exception(response.status_code, response.json())
+            raise_api_exception(response.status_code, _error_body(response))
 
     def _post_api_request(
         self, bearer_token: str, endpoint_url: str, payload: Any = None, data: Any = None
     ) -> requests.Response:
-        response = requests.post(
+        response = self._session.post(
             url=endpoint_url,
             json=payload,
             data=data,
@@ -219,7 +246,7 @@ class DecodableDataPlaneApiClient:
         if response.ok:
             return response
         else:
-            raise_api_exception(response.status_code, response.json())
+            raise_api_exception(response.status_code, _error_body(response))
 
 
 class DecodableControlPlaneApiClient:
@@ -229,54 +256,63 @@ class DecodableControlPlaneApiClient:
 
     def __init__(self, config: DecodableControlPlaneClientConfig):
         self.config = config
+        self._api_url = config.decodable_api_url()
+        self._streams_url = f"{self._api_url}/streams"
+        self._pipelines_url = f"{self._api_url}/pipelines"
+        self._connections_url = f"{self._api_url}/connections"
+        self._authorization = f"Bearer {config.access_token}"
+        # Reuses pooled keep-alive connections instead of a new TCP/TLS handshake per request
+        self._session = requests.Session()
+        self._stream_ids: Dict[str, str] = {}
+        self._pipeline_ids: Dict[str, str] = {}
+        self._connection_ids: Dict[str, str] = {}
 
     def test_connection(self) -> requests.Response:
-        response = requests.get(
-            url=f"{self.config.decodable_api_url()}/streams",
+        response = self._session.get(
+            url=self._streams_url,
             headers={
                 "accept": "application/json",
-                "authorization": f"Bearer {self.config.access_token}",
+                "authorization": self._authorization,
             },
         )
         return response
 
     def list_streams(self) -> ApiResponse:
         response = self._get_api_request(
-            endpoint_url=f"{self.config.decodable_api_url()}/streams",
+            endpoint_url=self._streams_url,
         )
         return self._parse_response(response.json())
 
-    def get_stream_id(self, name: str) -> Optional[str]:
-        streams = self.list_streams().items
-        stream_id = None
+    def iter_streams(self) -> Iterator[Dict[str, Any]]:
+        return self._iter_items(self._streams_url)
 
-        for stream in streams:
-            if stream["name"] == name:
-                stream_id = stream["id"]
+    def get_stream_id(self, name: str) -> Optional[str]:
+        return self._resolve_id(self._streams_url, self._stream_ids, name)
 
-        return stream_id
+    def invalidate_stream_cache(self) -> None:
+        self._stream_ids.clear()
 
     def get_stream_information(self, stream_id: str) -> Dict[str, Any]:
-        endpoint_url = f"{self.config.decodable_api_url()}/streams/{stream_id}"
-        response = requests.get(
+        endpoint_url = f"{self._streams_url}/{stream_id}"
+        response = self._session.get(
             url=endpoint_url,
             params=self._schema_v2_request_params,
             headers={
                 "accept": "application/json",
-                "authorization": f"Bearer {self.config.access_token}",
+                "authorization": self._authorization,
             },
         )
 
         if response.ok:
             return response.json()
         else:
-            raise_api_exception(response.status_code, response.json())
+            raise_api_exception(response.status_code, _error_body(response))
 
     def get_stream_from_sql(self, sql: str) -> Dict[str, Any]:
         return self._post_api_request(
             payload={"sql": sql},
             params=self._schema_v2_request_params,
-            endpoint_url=f"{self.config.decodable_api_url()}/pipelines/outputStream",
+            endpoint_url=f"{self._pipelines_url}/outputStream",
         ).json()
 
     def create_stream(
@@ -284,62 +320,62 @@ class DecodableControlPlaneApiClient:
         name: str,
         schema: SchemaV2,
     ) -> ApiResponse:
+        self.invalidate_stream_cache()
         return self._post_api_request(
             payload={"name": name, "schema_v2": schema.to_dict()},
             params=self._schema_v2_request_params,
-            endpoint_url=f"{self.config.decodable_api_url()}/streams",
+            endpoint_url=self._streams_url,
         ).json()
 
     def update_stream(self, stream_id: str, props: Dict[str, Any]) -> ApiResponse:
-        endpoint_url = f"{self.config.decodable_api_url()}/streams/{stream_id}"
+        self.invalidate_stream_cache()
+        endpoint_url = f"{self._streams_url}/{stream_id}"
         return self._patch_api_request(payload=props, endpoint_url=endpoint_url).json()
 
     def delete_stream(self, stream_id: str) -> None:
-        return self._delete_api_request(
-            endpoint_url=f"{self.config.decodable_api_url()}/streams/{stream_id}"
-        )
+        self.invalidate_stream_cache()
+        return self._delete_api_request(endpoint_url=f"{self._streams_url}/{stream_id}")
 
     def get_clear_stream_token(self, stream_id: str) -> DataPlaneTokenResponse:
         response = self._post_api_request(
             payload={},
-            endpoint_url=f"{self.config.decodable_api_url()}/streams/{stream_id}/clear/token",
+            endpoint_url=f"{self._streams_url}/{stream_id}/clear/token",
         )
         return DataPlaneTokenResponse.from_dict(response.json())
 
     def list_pipelines(self) -> ApiResponse:
         response = self._get_api_request(
-            endpoint_url=f"{self.config.decodable_api_url()}/pipelines",
+            endpoint_url=self._pipelines_url,
         )
         return self._parse_response(response.json())
 
-    def get_pipeline_id(self, name: str) -> Optional[str]:
-        pipelines = self.list_pipelines().items
-        pipeline_id = None
+    def iter_pipelines(self) -> Iterator[Dict[str, Any]]:
+        return self._iter_items(self._pipelines_url)
 
-        for pipeline in pipelines:
-            if pipeline["name"] == name:
-                pipeline_id = pipeline["id"]
+    def get_pipeline_id(self, name: str) -> Optional[str]:
+        return self._resolve_id(self._pipelines_url, self._pipeline_ids, name)
 
-        return pipeline_id
+    def invalidate_pipeline_cache(self) -> None:
+        self._pipeline_ids.clear()
 
     def get_pipeline_information(self, pipeline_id: str) -> Dict[str, Any]:
-        endpoint_url = f"{self.config.decodable_api_url()}/pipelines/{pipeline_id}"
-        response = requests.get(
+        endpoint_url = f"{self._pipelines_url}/{pipeline_id}"
+        response = self._session.get(
             url=endpoint_url,
             headers={
                 "accept": "application/json",
-                "authorization": f"Bearer {self.config.access_token}",
+                "authorization": self._authorization,
             },
         )
 
         if response.ok:
             return response.json()
         else:
-            raise_api_exception(response.status_code, response.json())
+            raise_api_exception(response.status_code, _error_body(response))
 
     def get_associated_streams(self, pipeline_id: str) -> ApiResponse:
         response = self._get_api_request(
-            endpoint_url=f"{self.config.decodable_api_url()}/pipelines/{pipeline_id}/streams"
+            endpoint_url=f"{self._pipelines_url}/{pipeline_id}/streams"
         )
         return self._parse_response(response.json())
 
@@ -350,32 +386,31 @@ class DecodableControlPlaneApiClient:
             "description": description,
         }
 
-        return self._post_api_request(
-            payload=payload, endpoint_url=f"{self.config.decodable_api_url()}/pipelines"
-        ).json()
+        self.invalidate_pipeline_cache()
+        return self._post_api_request(payload=payload, endpoint_url=self._pipelines_url).json()
 
     def update_pipeline(self, pipeline_id: str, props: Dict[str, Any]) -> Any:
+        self.invalidate_pipeline_cache()
         return self._patch_api_request(
             payload=props,
-            endpoint_url=f"{self.config.decodable_api_url()}/pipelines/{pipeline_id}",
+            endpoint_url=f"{self._pipelines_url}/{pipeline_id}",
         ).json()
 
     def activate_pipeline(self, pipeline_id: str) -> Dict[str, Any]:
         return self._post_api_request(
             payload={},
-            endpoint_url=f"{self.config.decodable_api_url()}/pipelines/{pipeline_id}/activate",
+            endpoint_url=f"{self._pipelines_url}/{pipeline_id}/activate",
         ).json()
 
     def deactivate_pipeline(self, pipeline_id: str) -> Dict[str, Any]:
         return self._post_api_request(
             payload={},
-            endpoint_url=f"{self.config.decodable_api_url()}/pipelines/{pipeline_id}/deactivate",
+            endpoint_url=f"{self._pipelines_url}/{pipeline_id}/deactivate",
         ).json()
 
     def delete_pipeline(self, pipeline_id: str) -> None:
-        return self._delete_api_request(
-            endpoint_url=f"{self.config.decodable_api_url()}/pipelines/{pipeline_id}"
-        )
+        self.invalidate_pipeline_cache()
+        return self._delete_api_request(endpoint_url=f"{self._pipelines_url}/{pipeline_id}")
 
     def get_preview_tokens(
         self,
@@ -385,14 +420,13 @@ class DecodableControlPlaneApiClient:
     ) -> PreviewTokensResponse:
         if input_streams is None:
             input_streams = []
+        start_position = {"type": "TAG", "value": preview_start.value}
         payload = {
             "sql": sql,
-            "start_positions": {
-                stream: {"type": "TAG", "value": preview_start.value} for stream in input_streams
-            },
+            "start_positions": {stream: start_position for stream in input_streams},
         }
         response = self._post_api_request(
-            payload=payload, endpoint_url=f"{self.config.decodable_api_url()}/preview/tokens"
+            payload=payload, endpoint_url=f"{self._api_url}/preview/tokens"
         )
         return PreviewTokensResponse.from_dict(response.json())
 
@@ -400,25 +434,23 @@ class DecodableControlPlaneApiClient:
         payload = {"sql": sql}
 
         return self._post_api_request(
-            payload=payload, endpoint_url=f"{self.config.decodable_api_url()}/preview/dependencies"
+            payload=payload, endpoint_url=f"{self._api_url}/preview/dependencies"
         ).json()
 
     def list_connections(self) -> ApiResponse:
         response = self._get_api_request(
-            endpoint_url=f"{self.config.decodable_api_url()}/connections",
+            endpoint_url=self._connections_url,
         )
         return self._parse_response(response.json())
 
-    def get_connection_id(self, name: str) -> Optional[str]:
-        connections = self.list_connections().items
-        conn_id = None
+    def iter_connections(self) -> Iterator[Dict[str, Any]]:
+        return self._iter_items(self._connections_url)
 
-        for conn in connections:
-            if conn["name"] == name:
-                conn_id = conn["id"]
-                break
+    def get_connection_id(self, name: str) -> Optional[str]:
+        return self._resolve_id(self._connections_url, self._connection_ids, name)
 
-        return conn_id
+    def invalidate_connection_cache(self) -> None:
+        self._connection_ids.clear()
 
     def create_connection(
         self,
@@ -438,108 +470,156 @@ class DecodableControlPlaneApiClient:
             "schema_v2": schema.to_dict(),
         }
 
+        # The connection also creates its backing stream
+        self.invalidate_connection_cache()
+        self.invalidate_stream_cache()
         return self._post_api_request(
             payload=payload,
-            params=self._schema_v2_request_params,
-            endpoint_url=f"{self.config.decodable_api_url()}/connections?stream_name={stream}",
+            params={**self._schema_v2_request_params, "stream_name": stream},
+            endpoint_url=self._connections_url,
         ).json()
 
     def activate_connection(self, conn_id: str) -> Dict[str, Any]:
         return self._post_api_request(
             payload={},
             params=self._schema_v2_request_params,
-            endpoint_url=f"{self.config.decodable_api_url()}/connections/{conn_id}/activate",
+            endpoint_url=f"{self._connections_url}/{conn_id}/activate",
         ).json()
 
     def deactivate_connection(self, conn_id: str) -> Dict[str, Any]:
         return self._post_api_request(
             payload={},
             params=self._schema_v2_request_params,
-            endpoint_url=f"{self.config.decodable_api_url()}/connections/{conn_id}/deactivate",
+            endpoint_url=f"{self._connections_url}/{conn_id}/deactivate",
         ).json()
 
     def delete_connection(self, conn_id: str):
-        self._delete_api_request(
-            endpoint_url=f"{self.config.decodable_api_url()}/connections/{conn_id}"
-        )
+        self.invalidate_connection_cache()
+        self._delete_api_request(endpoint_url=f"{self._connections_url}/{conn_id}")
 
-    def send_events(self, id: str, events: List[Dict[str, Any]]) -> int:
-        payload = {"events": events}
+    def send_events(self, id: str, events: List[Dict[str, Any]], batch_size: int = 1000) -> int:
+        """Post events in batches of at most batch_size and return the total count received.
 
-        response = self._post_api_request(
-            payload=payload,
-            endpoint_url=f"{self.config.decodable_api_url()}/connections/{id}/events",
-        ).json()
+        An empty events list sends no request and returns 0.
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+        endpoint_url = f"{self._connections_url}/{id}/events"
+
+        # Send in bounded chunks so large seeds don't build a single huge request body
+        count = 0
+        for start in range(0, len(events), batch_size):
+            response = self._post_api_request(
+                payload={"events": events[start : start + batch_size]},
+                endpoint_url=endpoint_url,
+            ).json()
+            count += response["count"]
 
-        return response["count"]
+        return count
 
     def get_account_info(self, account_name: str) -> AccountInfoResponse:
-        response = self._get_api_request(
-            endpoint_url=f"{self.config.decodable_api_url()}/accounts/{account_name}"
-        )
+        response = self._get_api_request(endpoint_url=f"{self._api_url}/accounts/{account_name}")
 
         return AccountInfoResponse.from_dict(response.json())
 
     def _parse_response(self, result: Any) -> ApiResponse:
         return ApiResponse(items=result["items"], next_page_token=result["next_page_token"])
 
+    def _iter_items(self, endpoint_url: str) -> Iterator[Any]:
+        params: dict[str, str] = {}
+        while True:
+            page = self._parse_response(
+                self._get_api_request(endpoint_url=endpoint_url, params=params).json()
+            )
+            yield from page.items
+            if not page.next_page_token:
+                return
+            params = {"start_page_token": page.next_page_token}
+
+    def _resolve_id(self, endpoint_url: str, ids: Dict[str, str], name: str) -> Optional[str]:
+        cached = ids.get(name)
+        if cached is not None:
+            # Clients on other threads may have deleted or renamed it, so confirm before reusing
+            try:
+                item = self._get_api_request(endpoint_url=f"{endpoint_url}/{cached}").json()
+                if item["name"] == name:
+                    return cached
+            except ResourceNotFound:
+                pass
+            del ids[name]
+
+        return self._find_id(self._iter_items(endpoint_url), ids, name)
+
+    @staticmethod
+    def _find_id(items: Iterator[Any], ids: Dict[str, str], name: str) -> Optional[str]:
+        # Indexes every item seen on the way, and stops fetching pages once `name` is found
+        for item in items:
+            ids[item["name"]] = item["id"]
+            if item["name"] == name:
+                return item["id"]
+        return None
+
     def _post_api_request(
         self, payload: Any, endpoint_url: str, params: dict[str, str] | None = None
     ) -> requests.Response:
-        response = requests.post(
+        response = self._session.post(
             url=endpoint_url,
             params=params,
             json=payload,
             headers={
                 "accept": "application/json",
                 "content-type": "application/json",
-                "authorization": f"Bearer {self.config.access_token}",
+                "authorization": self._authorization,
             },
         )
 
         if response.ok:
             return response
         else:
-            raise_api_exception(response.status_code, response.json())
+            raise_api_exception(response.status_code, _error_body(response))
 
     def _patch_api_request(self, payload: Any, endpoint_url: str) -> requests.Response:
-        response = requests.patch(
+        response = self._session.patch(
             url=endpoint_url,
             json=payload,
             headers={
                 "accept": "application/json",
                 "content-type": "application/json",
-                "authorization": f"Bearer {self.config.access_token}",
+                "authorization": self._authorization,
             },
         )
 
         if response.ok:
             return response
         else:
-            raise_api_exception(response.status_code, response.json())
+            raise_api_exception(response.status_code, _error_body(response))
 
-    def _get_api_request(self, endpoint_url: str) -> requests.Response:
-        response = requests.get(
+    def _get_api_request(
+        self, endpoint_url: str, params: dict[str, str] | None = None
+    ) -> requests.Response:
+        response = self._session.get(
             url=endpoint_url,
+            params=params,
             headers={
                 "accept": "application/json",
-                "authorization": f"Bearer {self.config.access_token}",
+                "authorization": self._authorization,
             },
         )
 
         if response.ok:
             return response
         else:
-            raise_api_exception(response.status_code, response.json())
+            raise_api_exception(response.status_code, _error_body(response))
 
     def _delete_api_request(self, endpoint_url: str) -> None:
-        response = requests.delete(
+        response = self._session.delete(
             url=endpoint_url,
             headers={
                 "accept": "application/json",
-                "authorization": f"Bearer {self.config.access_token}",
+                "authorization": self._authorization,
             },
         )
 
         if not response.ok:
-            raise_api_exception(response.status_code, response.json())
+            raise_api_exception(response.status_code, _error_body(response))
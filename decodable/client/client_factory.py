@@ -32,12 +32,14 @@ class DecodableClientFactory:
     ) -> DecodableControlPlaneApiClient:
         if decodable_account_name is None:
             raise Exception("Undefined Decodable account name. Update DBT profile")
-        profile_access_tokens = DecodableProfileReader.load_profiles()
-        if profile_name not in profile_access_tokens.profile_tokens:
+        access_token: Optional[str] = None
+        if profile_name is not None:
+            profile_tokens = DecodableProfileReader.load_profiles().profile_tokens
+            access_token = profile_tokens.get(profile_name)
+        if access_token is None:
             raise Exception(
                 f"Undefined '{profile_name} in decodable profile file ~/.decodable/auth"
             )
-        access_token = profile_access_tokens.profile_tokens[profile_name]
         return DecodableControlPlaneApiClient(
             config=DecodableControlPlaneClientConfig(
                 access_token=access_token, account_name=decodable_account_name, api_url=api_url
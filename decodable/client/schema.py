@@ -14,12 +14,10 @@
 #  limitations under the License.
 #
 
-
-import json
-
-from dataclasses import dataclass, asdict, field as dataclass_field, fields as dataclass_fields
+from operator import itemgetter
+from dataclasses import dataclass, field as dataclass_field, fields as dataclass_fields
 from decodable.client.types import FieldType
-from typing import Any, Sequence, List, Dict
+from typing import Any, Callable, Sequence, List, Dict, Optional, Tuple
 
 from dbt.exceptions import raise_compiler_error
 
@@ -43,6 +41,7 @@ class SchemaField:
         return field_type
 
     def to_dict(self) -> Dict[str, str]:
+        # Generic fallback; the built-in field kinds override this with a literal dict
         res = {}
         for field in dataclass_fields(self):
             field_value = getattr(self, field.name)
@@ -59,6 +58,9 @@ class PhysicalSchemaField(SchemaField):
     type: FieldType
     kind: str = dataclass_field(init=False, default=FieldKind.physical)
 
+    def to_dict(self) -> Dict[str, str]:
+        return {"name": self.name, "kind": self.kind, "type": repr(self.type)}
+
     @classmethod
     def get(cls, name: str, type: str) -> "PhysicalSchemaField":
         return cls(name, cls.get_field_type(type))
@@ -71,6 +73,9 @@ class MetadataSchemaField(SchemaField):
     type: FieldType
     kind: str = dataclass_field(init=False, default=FieldKind.metadata)
 
+    def to_dict(self) -> Dict[str, str]:
+        return {"name": self.name, "kind": self.kind, "key": self.key, "type": repr(self.type)}
+
     @classmethod
     def get(cls, name: str, key: str, type: str) -> "MetadataSchemaField":
         return cls(name, key, cls.get_field_type(type))
@@ -82,21 +87,29 @@ class ComputedSchemaField(SchemaField):
     expression: str
     kind: str = dataclass_field(init=False, default=FieldKind.computed)
 
+    def to_dict(self) -> Dict[str, str]:
+        return {"name": self.name, "kind": self.kind, "expression": self.expression}
+
     @classmethod
     def get(cls, name: str, expression: str) -> "ComputedSchemaField":
         return cls(name, expression)
 
 
+_FIELD_BUILDERS: Dict[str, Callable[[Dict[str, str]], SchemaField]] = {
+    FieldKind.physical: lambda field: PhysicalSchemaField.get(field["name"], field["type"]),
+    FieldKind.metadata: lambda field: MetadataSchemaField.get(
+        field["name"], field["key"], field["type"]
+    ),
+    FieldKind.computed: lambda field: ComputedSchemaField.get(field["name"], field["expression"]),
+}
+
+
 def schema_field_factory(field: Dict[str, str]) -> SchemaField:
     kind = field["kind"]
-    if kind == FieldKind.physical:
-        return PhysicalSchemaField.get(field["name"], field["type"])
-    elif kind == FieldKind.metadata:
-        return MetadataSchemaField.get(field["name"], field["key"], field["type"])
-    elif kind == FieldKind.computed:
-        return ComputedSchemaField.get(field["name"], field["expression"])
-    else:
+    builder = _FIELD_BUILDERS.get(kind)
+    if builder is None:
         raise ValueError(f"Unknown field kind: {kind}")
+    return builder(field)
 
 
 @dataclass(frozen=True)
@@ -110,25 +123,37 @@ class Watermark:
     expression: str
 
 
+_WATERMARK_FIELDS = itemgetter("name", "expression")
+
+
 @dataclass(frozen=True)
 class SchemaV2:
     fields: Sequence[SchemaField]
-    watermarks: List[Watermark]
+    watermarks: Sequence[Watermark]
     constraints: Constraints
+    _key: Tuple[Any, ...] = dataclass_field(init=False, repr=False, compare=False)
+    _hash: int = dataclass_field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Computed once, as schemas are compared and hashed far more often than they are built
+        key = (
+            tuple(_field_key(field) for field in self.fields),
+            tuple((w.name, w.expression) for w in self.watermarks),
+            tuple(self.constraints.primary_key or ()),
+        )
+        object.__setattr__(self, "_key", key)
+        object.__setattr__(self, "_hash", hash(key))
 
     @classmethod
     def from_json_components(
         cls,
-        fields: List[Dict[str, str]],
-        watermarks: List[Dict[str, str]],
+        fields: Sequence[Dict[str, str]],
+        watermarks: Sequence[Dict[str, str]],
         primary_key: List[str],
     ) -> "SchemaV2":
         return SchemaV2(
-            fields=[schema_field_factory(field) for field in fields],
-            watermarks=[
-                Watermark(name=w_json["name"], expression=w_json["expression"])
-                for w_json in watermarks
-            ],
+            fields=tuple(map(schema_field_factory, fields)),
+            watermarks=tuple(Watermark(*_WATERMARK_FIELDS(w_json)) for w_json in watermarks),
             constraints=Constraints(primary_key=primary_key),
         )
 
@@ -137,19 +162,30 @@ class SchemaV2:
         primary_key: List[str] = json.get("constraints", {}).get("primary_key", [])
         return cls.from_json_components(
             json["fields"],
-            json.get("watermarks", []),
+            json.get("watermarks", ()),
             primary_key,
         )
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "fields": [field.to_dict() for field in self.fields],
-            "watermarks": [asdict(w) for w in self.watermarks],
-            "constraints": asdict(self.constraints),
+            "watermarks": [{"name": w.name, "expression": w.expression} for w in self.watermarks],
+            "constraints": {"primary_key": self.constraints.primary_key},
         }
 
     def __hash__(self) -> int:
-        return hash(json.dumps(self.to_dict()))
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, type(self)) and hash(self) == hash(other)
+        return isinstance(other, type(self)) and self._key == other._key
+
+
+def _field_key(field: SchemaField) -> Tuple[Optional[str], ...]:
+    field_type = getattr(field, "type", None)
+    return (
+        field.name,
+        field.kind,
+        repr(field_type) if field_type is not None else None,
+        getattr(field, "key", None),
+        getattr(field, "expression", None),
+    )
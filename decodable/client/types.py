@@ -15,50 +15,76 @@
 #
 from __future__ import annotations
 
+import functools
 import re
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Type
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Type
+
+_KEYWORD_PATTERN = re.compile(r"[A-Z_]+")
+_CHAR_PATTERN = re.compile(r"CHAR\((?P<length>\d+)\)")
+_VARCHAR_PATTERN = re.compile(r"VARCHAR\((?P<length>\d+)\)")
+_BINARY_PATTERN = re.compile(r"BINARY\((?P<length>\d+)\)")
+_VARBINARY_PATTERN = re.compile(r"VARBINARY\((?P<length>\d+)\)")
+_DECIMAL_PATTERN = re.compile(r"DECIMAL(\((?P<precision>\d+)(, (?P<scale>\d+))?\))?")
+_DEC_PATTERN = re.compile(r"DEC(\((?P<precision>\d+)(, (?P<scale>\d+))?\))?")
+_NUMERIC_PATTERN = re.compile(r"NUMERIC(\((?P<precision>\d+)(, (?P<scale>\d+))?\))?")
+_TIME_PATTERN = re.compile(r"TIME\((?P<precision>\d+)\)")
+_TIMESTAMP_PATTERN = re.compile(
+    r"TIMESTAMP\((?P<precision>\d+)\)(?P<timezone_clause> (?P<with_clause>WITH|WITHOUT) TIME ZONE)?"
+)
+_TIMESTAMP_LTZ_PATTERN = re.compile(r"TIMESTAMP_LTZ\((?P<precision>\d+)\)")
+_TIMESTAMP_LOCAL_PATTERN = re.compile(r"TIMESTAMP\((?P<precision>\d+)\) WITH LOCAL TIME ZONE")
+
+
+def _split_top_level(s: str, sep: str) -> List[str]:
+    """Split on sep, ignoring occurrences nested inside <...> or (...)."""
+    parts: List[str] = []
+    depth = 0
+    start = 0
+    i = 0
+    while i < len(s):
+        c = s[i]
+        if c in "<(":
+            depth += 1
+        elif c in ">)":
+            depth -= 1
+        elif depth == 0 and s.startswith(sep, i):
+            parts.append(s[start:i])
+            i += len(sep)
+            start = i
+            continue
+        i += 1
+    parts.append(s[start:])
+    return parts
 
 
 @dataclass(frozen=True)
 class FieldType:
-    synonyms: List[FieldType] = field(init=False, repr=False, default_factory=lambda: [])
+    @property
+    def synonyms(self) -> FrozenSet[FieldType]:
+        return frozenset()
 
     def __eq__(self, __o: object) -> bool:
-        if not issubclass(__o.__class__, FieldType):
+        if not isinstance(__o, FieldType):
             return False
 
-        if __o in self.synonyms:
+        # Synonyms are only consulted once the cheap key comparison has failed
+        if self._key() == __o._key():
             return True
 
-        return self.__repr__() == __o.__repr__()
+        return __o in self.synonyms
 
     def __hash__(self) -> int:
-        return hash(repr(self))
+        return hash(self._key())
+
+    def _key(self) -> Tuple[Any, ...]:
+        # Mirrors __repr__: the type plus whatever parameters appear in the type string
+        return (type(self),)
 
     @classmethod
     def from_str(cls, type: str) -> Optional[FieldType]:
-        candidates: List[Type[FieldType]] = [
-            NotNull,
-            StringType,
-            BinaryType,
-            NumericType,
-            DateTimeType,
-            CompoundType,
-            Boolean,
-            Interval,
-            Multiset,
-            PrimaryKey,
-        ]
-
-        found: Optional[FieldType] = None
-        for candidate in candidates:
-            found = candidate.from_str(type)
-            if found:
-                break
-
-        return found
+        return _parse_type(type)
 
 
 @dataclass(frozen=True, eq=False)
@@ -68,22 +94,24 @@ class NotNull(FieldType):
     def __repr__(self) -> str:
         return f"{repr(self.inner_type)} NOT NULL"
 
+    def _key(self) -> Tuple[Any, ...]:
+        return (NotNull, self.inner_type._key())
+
     def __eq__(self, __o: object) -> bool:
         if not isinstance(__o, NotNull):
             return False
         return self.inner_type == __o.inner_type
 
     def __hash__(self) -> int:
-        return super().__hash__()
+        # Equality defers to the inner type, so the hash must too
+        return hash((NotNull, self.inner_type))
 
     @classmethod
     def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(r"(?P<inner>.*) NOT NULL", type)
-
-        if not found:
+        if not type.endswith(" NOT NULL"):
             return None
 
-        inner_type = FieldType.from_str(found["inner"])
+        inner_type = FieldType.from_str(type[: -len(" NOT NULL")])
 
         if not inner_type:
             return None
@@ -96,27 +124,18 @@ class StringType(FieldType):
     length: int
     is_synonym: bool = False
 
-    @classmethod
-    def from_str(cls, type: str) -> Optional[FieldType]:
-        candidates: List[Type[FieldType]] = [Char, Varchar, String]
-
-        found: Optional[FieldType] = None
-        for candidate in candidates:
-            found = candidate.from_str(type)
-            if found:
-                break
-
-        return found
-
 
 @dataclass(frozen=True, eq=False)
 class Char(StringType):
     def __repr__(self) -> str:
         return f"CHAR({self.length})"
 
+    def _key(self) -> Tuple[Any, ...]:
+        return (Char, self.length)
+
     @classmethod
     def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(r"CHAR\((?P<length>\d+)\)", type)
+        found = _CHAR_PATTERN.fullmatch(type)
 
         if not found:
             return None
@@ -129,13 +148,23 @@ class Varchar(StringType):
     def __repr__(self) -> str:
         return f"VARCHAR({self.length})"
 
-    def __post_init__(self):
-        if not self.is_synonym and self.length == String.length:
-            self.synonyms.append(String(is_synonym=True))
+    def _key(self) -> Tuple[Any, ...]:
+        return (Varchar, self.length)
+
+    @property
+    def synonyms(self) -> FrozenSet[FieldType]:
+        if self.is_synonym or self.length != String.length:
+            return frozenset()
+        return self._synonyms_for()
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _synonyms_for(cls) -> FrozenSet[FieldType]:
+        return frozenset((String(is_synonym=True),))
 
     @classmethod
     def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(r"VARCHAR\((?P<length>\d+)\)", type)
+        found = _VARCHAR_PATTERN.fullmatch(type)
 
         if not found:
             return None
@@ -150,18 +179,23 @@ class String(StringType):
     def __repr__(self) -> str:
         return "STRING"
 
-    def __post_init__(self):
-        if not self.is_synonym:
-            self.synonyms.append(Varchar(self.length, is_synonym=True))
+    def _key(self) -> Tuple[Any, ...]:
+        return (String,)
 
-    @classmethod
-    def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(r"STRING", type)
+    @property
+    def synonyms(self) -> FrozenSet[FieldType]:
+        if self.is_synonym:
+            return frozenset()
+        return self._synonyms_for(self.length)
 
-        if not found:
-            return None
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _synonyms_for(cls, length: int) -> FrozenSet[FieldType]:
+        return frozenset((Varchar(length, is_synonym=True),))
 
-        return cls()
+    @classmethod
+    def from_str(cls, type: str) -> Optional[FieldType]:
+        return cls() if type == "STRING" else None
 
 
 @dataclass(frozen=True, eq=False)
@@ -169,27 +203,18 @@ class BinaryType(FieldType):
     length: int
     is_synonym: bool = False
 
-    @classmethod
-    def from_str(cls, type: str) -> Optional[FieldType]:
-        candidates: List[Type[FieldType]] = [Binary, Varbinary, Bytes]
-
-        found: Optional[FieldType] = None
-        for candidate in candidates:
-            found = candidate.from_str(type)
-            if found:
-                break
-
-        return found
-
 
 @dataclass(frozen=True, eq=False)
 class Binary(BinaryType):
     def __repr__(self) -> str:
         return f"BINARY({self.length})"
 
+    def _key(self) -> Tuple[Any, ...]:
+        return (Binary, self.length)
+
     @classmethod
     def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(r"BINARY\((?P<length>\d+)\)", type)
+        found = _BINARY_PATTERN.fullmatch(type)
 
         if not found:
             return None
@@ -202,13 +227,23 @@ class Varbinary(BinaryType):
     def __repr__(self) -> str:
         return f"VARBINARY({self.length})"
 
-    def __post_init__(self):
-        if not self.is_synonym and self.length == Bytes.length:
-            self.synonyms.append(Bytes(is_synonym=True))
+    def _key(self) -> Tuple[Any, ...]:
+        return (Varbinary, self.length)
+
+    @property
+    def synonyms(self) -> FrozenSet[FieldType]:
+        if self.is_synonym or self.length != Bytes.length:
+            return frozenset()
+        return self._synonyms_for()
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _synonyms_for(cls) -> FrozenSet[FieldType]:
+        return frozenset((Bytes(is_synonym=True),))
 
     @classmethod
     def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(r"VARBINARY\((?P<length>\d+)\)", type)
+        found = _VARBINARY_PATTERN.fullmatch(type)
 
         if not found:
             return None
@@ -223,41 +258,28 @@ class Bytes(BinaryType):
     def __repr__(self) -> str:
         return "BYTES"
 
-    def __post_init__(self):
-        if not self.is_synonym:
-            self.synonyms.append(Varbinary(self.length, is_synonym=True))
-
-    @classmethod
-    def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(r"BYTES", type)
-
-        if not found:
-            return None
+    def _key(self) -> Tuple[Any, ...]:
+        return (Bytes,)
 
-        return cls()
+    @property
+    def synonyms(self) -> FrozenSet[FieldType]:
+        if self.is_synonym:
+            return frozenset()
+        return self._synonyms_for(self.length)
 
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _synonyms_for(cls, length: int) -> FrozenSet[FieldType]:
+        return frozenset((Varbinary(length, is_synonym=True),))
 
-@dataclass(frozen=True, eq=False)
-class NumericType(FieldType):
     @classmethod
     def from_str(cls, type: str) -> Optional[FieldType]:
-        candidates: List[Type[FieldType]] = [
-            ExactNumericType,
-            TinyInt,
-            SmallInt,
-            Int,
-            BigInt,
-            Float,
-            Double,
-        ]
+        return cls() if type == "BYTES" else None
 
-        found: Optional[FieldType] = None
-        for candidate in candidates:
-            found = candidate.from_str(type)
-            if found:
-                break
 
-        return found
+@dataclass(frozen=True, eq=False)
+class NumericType(FieldType):
+    pass
 
 
 @dataclass(frozen=True, eq=False)
@@ -266,18 +288,6 @@ class ExactNumericType(NumericType):
     scale: int
     is_synonym: bool = False
 
-    @classmethod
-    def from_str(cls, type: str) -> Optional[FieldType]:
-        candidates: List[Type[FieldType]] = [Decimal, Dec, Numeric]
-
-        found: Optional[FieldType] = None
-        for candidate in candidates:
-            found = candidate.from_str(type)
-            if found:
-                break
-
-        return found
-
 
 @dataclass(frozen=True, eq=False)
 class Decimal(ExactNumericType):
@@ -287,14 +297,25 @@ class Decimal(ExactNumericType):
     def __repr__(self) -> str:
         return f"DECIMAL({self.precision}, {self.scale})"
 
-    def __post_init__(self):
-        if not self.is_synonym:
-            self.synonyms.append(Dec(self.precision, self.scale, is_synonym=True))
-            self.synonyms.append(Numeric(self.precision, self.scale, is_synonym=True))
+    def _key(self) -> Tuple[Any, ...]:
+        return (Decimal, self.precision, self.scale)
+
+    @property
+    def synonyms(self) -> FrozenSet[FieldType]:
+        if self.is_synonym:
+            return frozenset()
+        return self._synonyms_for(self.precision, self.scale)
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _synonyms_for(cls, precision: int, scale: int) -> FrozenSet[FieldType]:
+        return frozenset(
+            (Dec(precision, scale, is_synonym=True), Numeric(precision, scale, is_synonym=True))
+        )
 
     @classmethod
     def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(r"DECIMAL(\((?P<precision>\d+)(, (?P<scale>\d+))?\))?", type)
+        found = _DECIMAL_PATTERN.fullmatch(type)
 
         if not found:
             return None
@@ -315,14 +336,28 @@ class Dec(ExactNumericType):
     def __repr__(self) -> str:
         return f"DEC({self.precision}, {self.scale})"
 
-    def __post_init__(self):
-        if not self.is_synonym:
-            self.synonyms.append(Decimal(self.precision, self.scale, is_synonym=True))
-            self.synonyms.append(Numeric(self.precision, self.scale, is_synonym=True))
+    def _key(self) -> Tuple[Any, ...]:
+        return (Dec, self.precision, self.scale)
+
+    @property
+    def synonyms(self) -> FrozenSet[FieldType]:
+        if self.is_synonym:
+            return frozenset()
+        return self._synonyms_for(self.precision, self.scale)
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _synonyms_for(cls, precision: int, scale: int) -> FrozenSet[FieldType]:
+        return frozenset(
+            (
+                Decimal(precision, scale, is_synonym=True),
+                Numeric(precision, scale, is_synonym=True),
+            )
+        )
 
     @classmethod
     def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(r"DEC(\((?P<precision>\d+)(, (?P<scale>\d+))?\))?", type)
+        found = _DEC_PATTERN.fullmatch(type)
 
         if not found:
             return None
@@ -343,14 +378,25 @@ class Numeric(ExactNumericType):
     def __repr__(self) -> str:
         return f"NUMERIC({self.precision}, {self.scale})"
 
-    def __post_init__(self):
-        if not self.is_synonym:
-            self.synonyms.append(Dec(self.precision, self.scale, is_synonym=True))
-            self.synonyms.append(Decimal(self.precision, self.scale, is_synonym=True))
+    def _key(self) -> Tuple[Any, ...]:
+        return (Numeric, self.precision, self.scale)
+
+    @property
+    def synonyms(self) -> FrozenSet[FieldType]:
+        if self.is_synonym:
+            return frozenset()
+        return self._synonyms_for(self.precision, self.scale)
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _synonyms_for(cls, precision: int, scale: int) -> FrozenSet[FieldType]:
+        return frozenset(
+            (Dec(precision, scale, is_synonym=True), Decimal(precision, scale, is_synonym=True))
+        )
 
     @classmethod
     def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(r"NUMERIC(\((?P<precision>\d+)(, (?P<scale>\d+))?\))?", type)
+        found = _NUMERIC_PATTERN.fullmatch(type)
 
         if not found:
             return None
@@ -370,12 +416,7 @@ class TinyInt(NumericType):
 
     @classmethod
     def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(r"TINYINT", type)
-
-        if not found:
-            return None
-
-        return cls()
+        return cls() if type == "TINYINT" else None
 
 
 @dataclass(frozen=True, eq=False)
@@ -385,12 +426,7 @@ class SmallInt(NumericType):
 
     @classmethod
     def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(r"SMALLINT", type)
-
-        if not found:
-            return None
-
-        return cls()
+        return cls() if type == "SMALLINT" else None
 
 
 @dataclass(frozen=True, eq=False)
@@ -400,12 +436,7 @@ class Int(NumericType):
 
     @classmethod
     def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(r"INT", type)
-
-        if not found:
-            return None
-
-        return cls()
+        return cls() if type == "INT" else None
 
 
 @dataclass(frozen=True, eq=False)
@@ -415,12 +446,7 @@ class BigInt(NumericType):
 
     @classmethod
     def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(r"BIGINT", type)
-
-        if not found:
-            return None
-
-        return cls()
+        return cls() if type == "BIGINT" else None
 
 
 @dataclass(frozen=True, eq=False)
@@ -430,18 +456,20 @@ class Float(NumericType):
     def __repr__(self) -> str:
         return "FLOAT"
 
-    def __post_init__(self):
-        if not self.is_synonym:
-            self.synonyms.append(Double(is_synonym=True))
+    @property
+    def synonyms(self) -> FrozenSet[FieldType]:
+        if self.is_synonym:
+            return frozenset()
+        return self._synonyms_for()
 
     @classmethod
-    def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(r"FLOAT", type)
-
-        if not found:
-            return None
+    @functools.lru_cache(maxsize=None)
+    def _synonyms_for(cls) -> FrozenSet[FieldType]:
+        return frozenset((Double(is_synonym=True),))
 
-        return cls()
+    @classmethod
+    def from_str(cls, type: str) -> Optional[FieldType]:
+        return cls() if type == "FLOAT" else None
 
 
 @dataclass(frozen=True, eq=False)
@@ -451,33 +479,25 @@ class Double(NumericType):
     def __repr__(self) -> str:
         return "DOUBLE"
 
-    def __post_init__(self):
-        if not self.is_synonym:
-            self.synonyms.append(Float(is_synonym=True))
+    @property
+    def synonyms(self) -> FrozenSet[FieldType]:
+        if self.is_synonym:
+            return frozenset()
+        return self._synonyms_for()
 
     @classmethod
-    def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(r"DOUBLE", type)
-
-        if not found:
-            return None
-
-        return cls()
+    @functools.lru_cache(maxsize=None)
+    def _synonyms_for(cls) -> FrozenSet[FieldType]:
+        return frozenset((Float(is_synonym=True),))
 
-
-@dataclass(frozen=True, eq=False)
-class DateTimeType(FieldType):
     @classmethod
     def from_str(cls, type: str) -> Optional[FieldType]:
-        candidates: List[Type[FieldType]] = [Date, Time, TimestampType]
+        return cls() if type == "DOUBLE" else None
 
-        found: Optional[FieldType] = None
-        for candidate in candidates:
-            found = candidate.from_str(type)
-            if found:
-                break
 
-        return found
+@dataclass(frozen=True, eq=False)
+class DateTimeType(FieldType):
+    pass
 
 
 @dataclass(frozen=True, eq=False)
@@ -487,12 +507,7 @@ class Date(DateTimeType):
 
     @classmethod
     def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(r"DATE", type)
-
-        if not found:
-            return None
-
-        return cls()
+        return cls() if type == "DATE" else None
 
 
 @dataclass(frozen=True, eq=False)
@@ -502,9 +517,12 @@ class Time(DateTimeType):
     def __repr__(self) -> str:
         return f"TIME({self.precision})"
 
+    def _key(self) -> Tuple[Any, ...]:
+        return (Time, self.precision)
+
     @classmethod
     def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(r"TIME\((?P<precision>\d+)\)", type)
+        found = _TIME_PATTERN.fullmatch(type)
 
         if not found:
             return None
@@ -518,18 +536,6 @@ class TimestampType(DateTimeType):
     timezone: bool
     is_synonym: bool = False
 
-    @classmethod
-    def from_str(cls, type: str) -> Optional[FieldType]:
-        candidates: List[Type[FieldType]] = [Timestamp, TimestampLocal]
-
-        found: Optional[FieldType] = None
-        for candidate in candidates:
-            found = candidate.from_str(type)
-            if found:
-                break
-
-        return found
-
 
 @dataclass(frozen=True, eq=False)
 class Timestamp(TimestampType):
@@ -543,16 +549,23 @@ class Timestamp(TimestampType):
 
         return f"TIMESTAMP({self.precision}) {w} TIME ZONE"
 
-    def __post_init__(self):
-        if not self.is_synonym and self.timezone:
-            self.synonyms.append(TimestampLocal(self.precision, is_synonym=True))
+    def _key(self) -> Tuple[Any, ...]:
+        return (Timestamp, self.precision, self.timezone)
+
+    @property
+    def synonyms(self) -> FrozenSet[FieldType]:
+        if self.is_synonym or not self.timezone:
+            return frozenset()
+        return self._synonyms_for(self.precision)
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _synonyms_for(cls, precision: int) -> FrozenSet[FieldType]:
+        return frozenset((TimestampLocal(precision, is_synonym=True),))
 
     @classmethod
     def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(
-            r"TIMESTAMP\((?P<precision>\d+)\)(?P<timezone_clause> (?P<with_clause>WITH|WITHOUT) TIME ZONE)?",
-            type,
-        )
+        found = _TIMESTAMP_PATTERN.fullmatch(type)
 
         if not found:
             return None
@@ -577,24 +590,28 @@ class TimestampLocal(TimestampType):
     def __repr__(self) -> str:
         return f"TIMESTAMP_LTZ({self.precision})"
 
-    def __post_init__(self):
-        if not self.is_synonym and self.timezone:
-            self.synonyms.append(Timestamp(self.precision, timezone=True, is_synonym=True))
+    def _key(self) -> Tuple[Any, ...]:
+        return (TimestampLocal, self.precision)
+
+    @property
+    def synonyms(self) -> FrozenSet[FieldType]:
+        if self.is_synonym or not self.timezone:
+            return frozenset()
+        return self._synonyms_for(self.precision)
 
     @classmethod
-    def from_str(cls, type: str) -> Optional[FieldType]:
-        found_shorthand = re.fullmatch(r"TIMESTAMP_LTZ\((?P<precision>\d+)\)", type)
-        found_full_version = re.fullmatch(
-            r"TIMESTAMP\((?P<precision>\d+)\) WITH LOCAL TIME ZONE", type
-        )
+    @functools.lru_cache(maxsize=None)
+    def _synonyms_for(cls, precision: int) -> FrozenSet[FieldType]:
+        return frozenset((Timestamp(precision, timezone=True, is_synonym=True),))
 
-        if found_shorthand:
-            return cls(int(found_shorthand["precision"]))
+    @classmethod
+    def from_str(cls, type: str) -> Optional[FieldType]:
+        found = _TIMESTAMP_LTZ_PATTERN.fullmatch(type) or _TIMESTAMP_LOCAL_PATTERN.fullmatch(type)
 
-        if found_full_version:
-            return cls(int(found_full_version["precision"]))
+        if not found:
+            return None
 
-        return None
+        return cls(int(found["precision"]))
 
 
 @dataclass(frozen=True)
@@ -605,33 +622,23 @@ class CompoundType(FieldType):
         ROW = 2
 
     container_type: ContainerType = field(init=False, repr=False)
-    internal_types: List[FieldType] = field(init=False, repr=False, default_factory=lambda: [])
-
-    @classmethod
-    def from_str(cls, type: str) -> Optional[FieldType]:
-        candidates: List[Type[FieldType]] = [ArrayType, Map, Row]
-
-        found: Optional[FieldType] = None
-        for candidate in candidates:
-            found = candidate.from_str(type)
-            if found:
-                break
-
-        return found
+    internal_types: Tuple[FieldType, ...] = field(init=False, repr=False, default=())
 
     def __eq__(self, __o: object) -> bool:
-        if not issubclass(__o.__class__, CompoundType):
+        if not isinstance(__o, CompoundType):
             return False
 
         return (
-            self.container_type
-            == __o.container_type  # pyright: ignore [reportGeneralTypeIssues], we know __o is a CompoundType
-            and self.internal_types
-            == __o.internal_types  # pyright: ignore [reportGeneralTypeIssues], we know __o is a CompoundType
+            self.container_type == __o.container_type and self.internal_types == __o.internal_types
         )
 
     def __hash__(self) -> int:
-        return super().__hash__()
+        # Hash the same fields __eq__ compares, so ARRAY<T> and T ARRAY land in the same bucket
+        return hash((self.container_type, self.internal_types))
+
+    def _key(self) -> Tuple[Any, ...]:
+        # Tagged by container rather than class, so wrappers see ARRAY<T> and T ARRAY as one key
+        return (self.container_type, *(t._key() for t in self.internal_types))
 
 
 @dataclass(frozen=True, eq=False)
@@ -642,19 +649,7 @@ class ArrayType(CompoundType):
     type: FieldType
 
     def __post_init__(self):
-        self.internal_types.append(self.type)
-
-    @classmethod
-    def from_str(cls, type: str) -> Optional[FieldType]:
-        candidates: List[Type[FieldType]] = [Array, TArray]
-
-        found: Optional[FieldType] = None
-        for candidate in candidates:
-            found = candidate.from_str(type)
-            if found:
-                break
-
-        return found
+        object.__setattr__(self, "internal_types", (self.type,))
 
 
 @dataclass(frozen=True, eq=False)
@@ -664,12 +659,10 @@ class Array(ArrayType):
 
     @classmethod
     def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(r"ARRAY<(?P<inner>.*)>", type)
-
-        if not found:
+        if not (type.startswith("ARRAY<") and type.endswith(">")):
             return None
 
-        inner_type = FieldType.from_str(found["inner"])
+        inner_type = FieldType.from_str(type[len("ARRAY<") : -1])
 
         if not inner_type:
             return None
@@ -684,12 +677,10 @@ class TArray(ArrayType):
 
     @classmethod
     def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(r"(?P<inner>.*) ARRAY", type)
-
-        if not found:
+        if not type.endswith(" ARRAY"):
             return None
 
-        inner_type = FieldType.from_str(found["inner"])
+        inner_type = FieldType.from_str(type[: -len(" ARRAY")])
 
         if not inner_type:
             return None
@@ -706,21 +697,23 @@ class Map(CompoundType):
     value: FieldType
 
     def __post_init__(self):
-        self.internal_types.append(self.key)
-        self.internal_types.append(self.value)
+        object.__setattr__(self, "internal_types", (self.key, self.value))
 
     def __repr__(self) -> str:
         return f"MAP<{self.key}, {self.value}>"
 
     @classmethod
     def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(r"MAP<(?P<key>.*), (?P<value>.*)>", type)
+        if not (type.startswith("MAP<") and type.endswith(">")):
+            return None
 
-        if not found:
+        parts = _split_top_level(type[len("MAP<") : -1], ", ")
+
+        if len(parts) != 2:
             return None
 
-        key_type = FieldType.from_str(found["key"])
-        value_type = FieldType.from_str(found["value"])
+        key_type = FieldType.from_str(parts[0])
+        value_type = FieldType.from_str(parts[1])
 
         if not key_type or not value_type:
             return None
@@ -747,14 +740,18 @@ class PrimaryKey(FieldType):
     def __repr__(self) -> str:
         return f"{self.inner_type} PRIMARY KEY"
 
+    def _key(self) -> Tuple[Any, ...]:
+        return (PrimaryKey, self.inner_type._key())
+
+    def __hash__(self) -> int:
+        return hash((PrimaryKey, self.inner_type))
+
     @classmethod
     def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(r"(?P<type>.*) PRIMARY KEY", type)
-
-        if not found:
+        if not type.endswith(" PRIMARY KEY"):
             return None
 
-        inner_type = FieldType.from_str(found["type"])
+        inner_type = FieldType.from_str(type[: -len(" PRIMARY KEY")])
 
         if not inner_type:
             return None
@@ -769,12 +766,7 @@ class Boolean(FieldType):
 
     @classmethod
     def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(r"BOOLEAN", type)
-
-        if not found:
-            return None
-
-        return cls()
+        return cls() if type == "BOOLEAN" else None
 
 
 @dataclass(frozen=True, eq=False)
@@ -784,12 +776,7 @@ class Interval(FieldType):
 
     @classmethod
     def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(r"INTERVAL", type)
-
-        if not found:
-            return None
-
-        return cls()
+        return cls() if type == "INTERVAL" else None
 
 
 @dataclass(frozen=True, eq=False)
@@ -799,9 +786,80 @@ class Multiset(FieldType):
 
     @classmethod
     def from_str(cls, type: str) -> Optional[FieldType]:
-        found = re.fullmatch(r"MULTISET", type)
+        return cls() if type == "MULTISET" else None
+
+
+_SUFFIX_DISPATCH: Tuple[Tuple[str, Type[FieldType]], ...] = (
+    (" NOT NULL", NotNull),
+    (" ARRAY", TArray),
+    (" PRIMARY KEY", PrimaryKey),
+)
+
+_KEYWORD_DISPATCH: Dict[str, Tuple[Type[FieldType], ...]] = {
+    "CHAR": (Char,),
+    "VARCHAR": (Varchar,),
+    "STRING": (String,),
+    "BINARY": (Binary,),
+    "VARBINARY": (Varbinary,),
+    "BYTES": (Bytes,),
+    "DECIMAL": (Decimal,),
+    "DEC": (Dec,),
+    "NUMERIC": (Numeric,),
+    "TINYINT": (TinyInt,),
+    "SMALLINT": (SmallInt,),
+    "INT": (Int,),
+    "BIGINT": (BigInt,),
+    "FLOAT": (Float,),
+    "DOUBLE": (Double,),
+    "DATE": (Date,),
+    "TIME": (Time,),
+    "TIMESTAMP": (Timestamp, TimestampLocal),
+    "TIMESTAMP_LTZ": (TimestampLocal,),
+    "ARRAY": (Array,),
+    "MAP": (Map,),
+    "ROW": (Row,),
+    "BOOLEAN": (Boolean,),
+    "INTERVAL": (Interval,),
+    "MULTISET": (Multiset,),
+}
+
+# Parameterless types parse to a single shared instance
+_LITERALS: Dict[str, FieldType] = {
+    "STRING": String(),
+    "BYTES": Bytes(),
+    "TINYINT": TinyInt(),
+    "SMALLINT": SmallInt(),
+    "INT": Int(),
+    "BIGINT": BigInt(),
+    "FLOAT": Float(),
+    "DOUBLE": Double(),
+    "DATE": Date(),
+    "BOOLEAN": Boolean(),
+    "INTERVAL": Interval(),
+    "MULTISET": Multiset(),
+}
+
+
+# Schemas repeat a small set of type strings, and parsed types are immutable, so share them
+@functools.lru_cache(maxsize=4096)
+def _parse_type(type: str) -> Optional[FieldType]:
+    literal = _LITERALS.get(type)
+    if literal is not None:
+        return literal
+
+    # Suffix forms wrap another type, so they take precedence over the leading keyword
+    for suffix, candidate in _SUFFIX_DISPATCH:
+        if type.endswith(suffix):
+            return candidate.from_str(type)
+
+    keyword = _KEYWORD_PATTERN.match(type)
+    if not keyword:
+        return None
 
-        if not found:
-            return None
+    found: Optional[FieldType] = None
+    for candidate in _KEYWORD_DISPATCH.get(keyword.group(), ()):
+        found = candidate.from_str(type)
+        if found:
+            break
 
-        return cls()
+    return found
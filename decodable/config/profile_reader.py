@@ -13,29 +13,42 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 #
+import functools
 import os
 from pathlib import Path
-from yaml import SafeLoader, load
+from yaml import load
 from typing import Optional
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 from decodable.config.profile import DecodableAccessTokens
 
-DEFAULT_PROFILE_PATH = f"{str(Path.home())}/.decodable/auth"
 PROFILE_ENV_VARIABLE_NAME = "DECODABLE_PROFILE"
 
 
+def _default_profile_path() -> Path:
+    return Path.home() / ".decodable" / "auth"
+
+
 class DecodableProfileReader:
     @staticmethod
-    def load_profiles(default_profile_path: str = DEFAULT_PROFILE_PATH) -> DecodableAccessTokens:
-        profiles_path = Path(default_profile_path)
-        if profiles_path.is_file() is False:
+    def load_profiles(default_profile_path: Optional[str] = None) -> DecodableAccessTokens:
+        if default_profile_path is None:
+            profiles_path = _default_profile_path()
+        else:
+            profiles_path = Path(default_profile_path)
+        if not profiles_path.is_file():
             raise Exception(
                 f"No decodable profile under path: {profiles_path}. Execute 'decodable login' command first"
             )
 
-        with open(profiles_path, "r") as file:
-            content = file.read()
-            return DecodableProfileReader._load_profile_access_tokens(content)
+        # Keyed on mtime so the file is parsed once per process, yet edits are still picked up
+        return DecodableProfileReader._load_profiles_cached(
+            str(profiles_path), profiles_path.stat().st_mtime_ns
+        )
 
     @staticmethod
     def get_profile_name(profile_name: Optional[str]) -> Optional[str]:
@@ -47,7 +60,15 @@ class DecodableProfileReader:
     @staticmethod
     def _load_profile_access_tokens(yaml: str) -> DecodableAccessTokens:
         config_data = load(yaml, Loader=SafeLoader)
-        access_tokens = {}
-        for profile_name in config_data["tokens"]:
-            access_tokens[profile_name] = config_data["tokens"][profile_name]["access_token"]
+        access_tokens = {
+            profile_name: profile["access_token"]
+            for profile_name, profile in config_data["tokens"].items()
+        }
         return DecodableAccessTokens(profile_tokens=access_tokens)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _load_profiles_cached(path: str, mtime_ns: int) -> DecodableAccessTokens:
+        with open(path, "r") as file:
+            content = file.read()
+            return DecodableProfileReader._load_profile_access_tokens(content)
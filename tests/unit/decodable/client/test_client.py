@@ -0,0 +1,248 @@
+#
+#  Copyright 2023 decodable Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+from typing import Any, Dict, List, Optional, Tuple
+from unittest import mock
+
+import pytest
+
+from decodable.client.client import DecodableControlPlaneApiClient
+from decodable.client.schema import Constraints, SchemaV2
+from decodable.config.client_config import DecodableControlPlaneClientConfig
+
+API_URL = "https://test.api.decodable.co/v1alpha2"
+STREAMS_URL = f"{API_URL}/streams"
+PIPELINES_URL = f"{API_URL}/pipelines"
+EMPTY_SCHEMA = SchemaV2(fields=[], watermarks=[], constraints=Constraints(primary_key=[]))
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, body: Any = None):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.reason = "Not Found" if status_code == 404 else "OK"
+        self.content = b"" if body is None else b"{}"
+        self._body = body
+
+    def json(self) -> Any:
+        return self._body
+
+
+class FakeSession:
+    """Serves the control plane's collection endpoints from an in-memory store."""
+
+    def __init__(self, page_size: int = 100, last_page_token: Optional[str] = None):
+        self.page_size = page_size
+        self.last_page_token = last_page_token
+        self.collections: Dict[str, Dict[str, Dict[str, Any]]] = {
+            STREAMS_URL: {},
+            PIPELINES_URL: {},
+        }
+        self.requests: List[Tuple[str, str, Optional[Dict[str, str]]]] = []
+        self.event_batches: List[int] = []
+        self._next_id = 0
+
+    def add(self, collection_url: str, name: str) -> str:
+        self._next_id += 1
+        item_id = f"id-{self._next_id}"
+        self.collections[collection_url][item_id] = {"id": item_id, "name": name}
+        return item_id
+
+    def get(self, url: str, params: Optional[Dict[str, str]] = None, **_: Any) -> FakeResponse:
+        self.requests.append(("GET", url, params))
+        if url in self.collections:
+            items = list(self.collections[url].values())
+            start = int((params or {}).get("start_page_token", 0))
+            end = start + self.page_size
+            next_page_token = str(end) if end < len(items) else self.last_page_token
+            return FakeResponse(
+                200, {"items": items[start:end], "next_page_token": next_page_token}
+            )
+        collection_url, item_id = url.rsplit("/", 1)
+        item = self.collections[collection_url].get(item_id)
+        return FakeResponse(200, item) if item else FakeResponse(404)
+
+    def post(self, url: str, json: Any = None, **_: Any) -> FakeResponse:
+        self.requests.append(("POST", url, None))
+        if url.endswith("/events"):
+            self.event_batches.append(len(json["events"]))
+            return FakeResponse(200, {"count": len(json["events"])})
+        return FakeResponse(200, self.collections[url][self.add(url, json["name"])])
+
+    def patch(self, url: str, json: Any = None, **_: Any) -> FakeResponse:
+        self.requests.append(("PATCH", url, None))
+        collection_url, item_id = url.rsplit("/", 1)
+        item = self.collections[collection_url][item_id]
+        item.update(json)
+        return FakeResponse(200, item)
+
+    def delete(self, url: str, **_: Any) -> FakeResponse:
+        self.requests.append(("DELETE", url, None))
+        collection_url, item_id = url.rsplit("/", 1)
+        del self.collections[collection_url][item_id]
+        return FakeResponse(200)
+
+    def list_requests(self, collection_url: str) -> int:
+        return sum(
+            1 for method, url, _ in self.requests if method == "GET" and url == collection_url
+        )
+
+
+@pytest.fixture
+def session() -> FakeSession:
+    return FakeSession()
+
+
+def make_client(session: FakeSession) -> DecodableControlPlaneApiClient:
+    config = DecodableControlPlaneClientConfig(
+        account_name="test", access_token="token", api_url="api.decodable.co/v1alpha2"
+    )
+    with mock.patch("decodable.client.client.requests.Session", return_value=session):
+        return DecodableControlPlaneApiClient(config)
+
+
+@pytest.fixture
+def client(session: FakeSession) -> DecodableControlPlaneApiClient:
+    return make_client(session)
+
+
+class TestIdCache:
+    def test_cached_id_is_confirmed_without_listing(
+        self, client: DecodableControlPlaneApiClient, session: FakeSession
+    ):
+        stream_id = session.add(STREAMS_URL, "stream1")
+
+        assert client.get_stream_id("stream1") == stream_id
+        session.requests.clear()
+
+        assert client.get_stream_id("stream1") == stream_id
+        assert session.requests == [("GET", f"{STREAMS_URL}/{stream_id}", None)]
+
+    def test_miss_lists_again(self, client: DecodableControlPlaneApiClient, session: FakeSession):
+        assert client.get_stream_id("stream1") is None
+
+        stream_id = session.add(STREAMS_URL, "stream1")
+        assert client.get_stream_id("stream1") == stream_id
+        assert session.list_requests(STREAMS_URL) == 2
+
+    def test_deleted_elsewhere(self, client: DecodableControlPlaneApiClient, session: FakeSession):
+        pipeline_id = session.add(PIPELINES_URL, "pipeline1")
+        assert client.get_pipeline_id("pipeline1") == pipeline_id
+
+        # Another connection's client deletes it
+        del session.collections[PIPELINES_URL][pipeline_id]
+        assert client.get_pipeline_id("pipeline1") is None
+
+    def test_renamed_elsewhere(self, client: DecodableControlPlaneApiClient, session: FakeSession):
+        stream_id = session.add(STREAMS_URL, "stream1")
+        assert client.get_stream_id("stream1") == stream_id
+
+        # Another connection's client renames it
+        session.collections[STREAMS_URL][stream_id]["name"] = "stream2"
+        assert client.get_stream_id("stream1") is None
+        assert client.get_stream_id("stream2") == stream_id
+
+    def test_create_invalidates(
+        self, client: DecodableControlPlaneApiClient, session: FakeSession
+    ):
+        session.add(STREAMS_URL, "stream1")
+        client.get_stream_id("stream1")
+
+        client.create_stream("stream2", EMPTY_SCHEMA)
+        session.requests.clear()
+        client.get_stream_id("stream1")
+        assert session.requests == [("GET", STREAMS_URL, {})]
+
+    def test_update_invalidates(
+        self, client: DecodableControlPlaneApiClient, session: FakeSession
+    ):
+        pipeline_id = session.add(PIPELINES_URL, "pipeline1")
+        client.get_pipeline_id("pipeline1")
+
+        client.update_pipeline(pipeline_id, {"name": "pipeline2"})
+        session.requests.clear()
+        assert client.get_pipeline_id("pipeline1") is None
+        assert session.requests == [("GET", PIPELINES_URL, {})]
+
+    def test_delete_invalidates(
+        self, client: DecodableControlPlaneApiClient, session: FakeSession
+    ):
+        stream_id = session.add(STREAMS_URL, "stream1")
+        client.get_stream_id("stream1")
+
+        client.delete_stream(stream_id)
+        session.requests.clear()
+        assert client.get_stream_id("stream1") is None
+        assert session.requests == [("GET", STREAMS_URL, {})]
+
+
+class TestPagination:
+    @pytest.mark.parametrize("last_page_token", [None, ""])
+    def test_iter_follows_page_tokens(self, last_page_token: Optional[str]):
+        session = FakeSession(page_size=2, last_page_token=last_page_token)
+        names = [f"stream{i}" for i in range(5)]
+        for name in names:
+            session.add(STREAMS_URL, name)
+        client = make_client(session)
+
+        assert [stream["name"] for stream in client.iter_streams()] == names
+        assert session.requests == [
+            ("GET", STREAMS_URL, {}),
+            ("GET", STREAMS_URL, {"start_page_token": "2"}),
+            ("GET", STREAMS_URL, {"start_page_token": "4"}),
+        ]
+
+    def test_iter_empty_collection(
+        self, client: DecodableControlPlaneApiClient, session: FakeSession
+    ):
+        assert list(client.iter_pipelines()) == []
+        assert session.requests == [("GET", PIPELINES_URL, {})]
+
+    def test_get_id_stops_at_the_page_with_the_match(
+        self, client: DecodableControlPlaneApiClient, session: FakeSession
+    ):
+        session.page_size = 2
+        for i in range(5):
+            session.add(STREAMS_URL, f"stream{i}")
+
+        assert client.get_stream_id("stream3") == "id-4"
+        assert session.list_requests(STREAMS_URL) == 2
+
+
+class TestSendEvents:
+    @pytest.mark.parametrize(
+        "event_count,expected_batches",
+        [(0, []), (3, [3]), (4, [3, 1]), (7, [3, 3, 1])],
+    )
+    def test_send_events_batches(
+        self,
+        client: DecodableControlPlaneApiClient,
+        session: FakeSession,
+        event_count: int,
+        expected_batches: List[int],
+    ):
+        events = [{"value": str(i)} for i in range(event_count)]
+
+        assert client.send_events("conn1", events, batch_size=3) == event_count
+        assert session.event_batches == expected_batches
+
+    @pytest.mark.parametrize("batch_size", [0, -1])
+    def test_send_events_rejects_non_positive_batch_size(
+        self, client: DecodableControlPlaneApiClient, session: FakeSession, batch_size: int
+    ):
+        with pytest.raises(ValueError, match="batch_size must be positive"):
+            client.send_events("conn1", [{"value": "1"}], batch_size=batch_size)
+        assert session.requests == []
@@ -14,7 +14,11 @@
 #  limitations under the License.
 #
 
-import unittest
+from dataclasses import dataclass, field as dataclass_field
+from typing import Any, Dict, Type
+
+import pytest
+
 from decodable.client.schema import (
     SchemaField,
     PhysicalSchemaField,
@@ -26,150 +30,185 @@ from decodable.client.schema import (
     MetadataSchemaField,
     ComputedSchemaField,
 )
-from decodable.client.types import String, Int
-import json
+from decodable.client.types import FieldType, String, Int
+
+# Field types are immutable, so every test can share one instance of each
+STRING_TYPE = String()
+INT_TYPE = Int()
+
+# The same one-field schema, as an API payload and as its parsed components. Nothing mutates them.
+SCHEMA_JSON: Dict[str, Any] = {
+    "fields": [{"name": "field1", "kind": "physical", "type": "STRING"}],
+    "watermarks": [{"name": "wm1", "expression": "expr1"}],
+    "constraints": {"primary_key": ["field1"]},
+}
+SCHEMA_FIELDS = [PhysicalSchemaField(name="field1", type=STRING_TYPE)]
+SCHEMA_WATERMARKS = [Watermark(name="wm1", expression="expr1")]
+SCHEMA_CONSTRAINTS = Constraints(primary_key=["field1"])
 
 
-class TestSchemaField(unittest.TestCase):
+class TestSchemaField:
     def test_get_field_type_valid(self):
         field_type = SchemaField.get_field_type("STRING")
-        self.assertEqual(field_type, String())
+        assert field_type == STRING_TYPE
 
     def test_get_field_type_invalid_lowercase(self):
-        with self.assertRaises(Exception) as context:
+        with pytest.raises(Exception) as context:
             SchemaField.get_field_type("string")
-        self.assertTrue("Type 'string' not recognized" in str(context.exception))
+        assert "Type 'string' not recognized" in str(context.value)
+
+    def test_to_dict_fallback(self):
+        @dataclass(frozen=True)
+        class TaggedSchemaField(SchemaField):
+            name: str
+            type: FieldType
+            tag: str
+            kind: str = dataclass_field(init=False, default="tagged")
+
+        field = TaggedSchemaField(name="field1", type=STRING_TYPE, tag="t1")
+        assert field.to_dict() == {
+            "name": "field1",
+            "kind": "tagged",
+            "type": "STRING",
+            "tag": "t1",
+        }
+        assert str(field) == "name: 'field1' | kind: 'tagged' | type: 'STRING' | tag: 't1'"
 
 
-class TestPhysicalSchemaField(unittest.TestCase):
+class TestPhysicalSchemaField:
     def test_to_dict(self):
-        field = PhysicalSchemaField(name="field1", type=String())
+        field = PhysicalSchemaField(name="field1", type=STRING_TYPE)
         expected_dict = {"name": "field1", "type": "STRING", "kind": "physical"}
-        self.assertEqual(field.to_dict(), expected_dict)
+        assert field.to_dict() == expected_dict
 
     def test_eq(self):
-        field1 = PhysicalSchemaField(name="field1", type=String())
-        field2 = PhysicalSchemaField(name="field1", type=String())
-        self.assertEqual(field1, field2)
+        field1 = PhysicalSchemaField(name="field1", type=STRING_TYPE)
+        field2 = PhysicalSchemaField(name="field1", type=STRING_TYPE)
+        assert field1 == field2
 
     def test_str(self):
-        field = PhysicalSchemaField(name="field1", type=String())
-        self.assertEqual(str(field), "name: 'field1' | kind: 'physical' | type: 'STRING'")
+        field = PhysicalSchemaField(name="field1", type=STRING_TYPE)
+        assert str(field) == "name: 'field1' | kind: 'physical' | type: 'STRING'"
 
     def test_hash(self):
-        field1 = PhysicalSchemaField(name="field1", type=String())
-        field2 = PhysicalSchemaField(name="field1", type=String())
-        self.assertEqual(hash(field1), hash(field2))
+        field1 = PhysicalSchemaField(name="field1", type=STRING_TYPE)
+        field2 = PhysicalSchemaField(name="field1", type=STRING_TYPE)
+        assert hash(field1) == hash(field2)
 
     def test_get(self):
         field = PhysicalSchemaField.get(name="field1", type="INT")
-        self.assertEqual(field.name, "field1")
-        self.assertEqual(field.type, Int())
-        self.assertEqual(field.kind, FieldKind.physical)
+        assert field.name == "field1"
+        assert field.type == INT_TYPE
+        assert field.kind == FieldKind.physical
+
 
+class TestMetadataSchemaField:
+    def test_to_dict(self):
+        field = MetadataSchemaField(name="field1", key="key1", type=STRING_TYPE)
+        expected_dict = {"name": "field1", "kind": "metadata", "key": "key1", "type": "STRING"}
+        assert field.to_dict() == expected_dict
 
-class TestMetadataSchemaField(unittest.TestCase):
     def test_eq(self):
-        field1 = MetadataSchemaField(name="field1", key="key1", type=String())
-        field2 = MetadataSchemaField(name="field1", key="key1", type=String())
-        self.assertEqual(field1, field2)
+        field1 = MetadataSchemaField(name="field1", key="key1", type=STRING_TYPE)
+        field2 = MetadataSchemaField(name="field1", key="key1", type=STRING_TYPE)
+        assert field1 == field2
 
 
-class TestComputedSchemaField(unittest.TestCase):
+class TestComputedSchemaField:
+    def test_to_dict(self):
+        field = ComputedSchemaField(name="field1", expression="expr1")
+        expected_dict = {"name": "field1", "kind": "computed", "expression": "expr1"}
+        assert field.to_dict() == expected_dict
+
     def test_eq(self):
         field1 = ComputedSchemaField(name="field1", expression="expr1")
         field2 = ComputedSchemaField(name="field1", expression="expr1")
-        self.assertEqual(field1, field2)
-
+        assert field1 == field2
 
-class TestSchemaV2(unittest.TestCase):
-    def test_from_json_components(self):
-        fields = [{"name": "field1", "kind": "physical", "type": "STRING"}]
-        watermarks = [{"name": "wm1", "expression": "expr1"}]
-        primary_key = ["field1"]
-        schema = SchemaV2.from_json_components(fields, watermarks, primary_key)
-        self.assertEqual(len(schema.fields), 1)
-        self.assertEqual(schema.fields[0].name, "field1")
-        self.assertEqual(len(schema.watermarks), 1)
-        self.assertEqual(schema.watermarks[0].name, "wm1")
-        self.assertEqual(schema.constraints.primary_key, primary_key)
-
-    def test_from_json(self):
-        json_data = {
-            "fields": [{"name": "field1", "kind": "physical", "type": "STRING"}],
-            "watermarks": [{"name": "wm1", "expression": "expr1"}],
-            "constraints": {"primary_key": ["field1"]},
-        }
-        schema = SchemaV2.from_json(json_data)
-        self.assertEqual(len(schema.fields), 1)
-        self.assertEqual(schema.fields[0].name, "field1")
-        self.assertEqual(len(schema.watermarks), 1)
-        self.assertEqual(schema.watermarks[0].name, "wm1")
-        self.assertEqual(schema.constraints.primary_key, ["field1"])
 
-    def test_to_dict(self):
-        fields = [PhysicalSchemaField(name="field1", type=String())]
-        watermarks = [Watermark(name="wm1", expression="expr1")]
-        constraints = Constraints(primary_key=["field1"])
-        schema = SchemaV2(fields=fields, watermarks=watermarks, constraints=constraints)
-        expected_dict = {
-            "fields": [{"name": "field1", "type": "STRING", "kind": "physical"}],
-            "watermarks": [{"name": "wm1", "expression": "expr1"}],
-            "constraints": {"primary_key": ["field1"]},
-        }
-        self.assertEqual(schema.to_dict(), expected_dict)
+@pytest.fixture(scope="class")  # pyright: ignore [reportUntypedFunctionDecorator]
+def schema() -> SchemaV2:
+    return SchemaV2(
+        fields=SCHEMA_FIELDS, watermarks=SCHEMA_WATERMARKS, constraints=SCHEMA_CONSTRAINTS
+    )
 
-    def test_eq(self):
-        fields = [PhysicalSchemaField(name="field1", type=String())]
-        watermarks = [Watermark(name="wm1", expression="expr1")]
-        constraints = Constraints(primary_key=["field1"])
-        schema1 = SchemaV2(fields=fields, watermarks=watermarks, constraints=constraints)
-        schema2 = SchemaV2(fields=fields, watermarks=watermarks, constraints=constraints)
-        self.assertEqual(schema1, schema2)
 
-    def test_hash(self):
-        fields = [PhysicalSchemaField(name="field1", type=String())]
-        watermarks = [Watermark(name="wm1", expression="expr1")]
-        constraints = Constraints(primary_key=["field1"])
-        schema = SchemaV2(fields=fields, watermarks=watermarks, constraints=constraints)
-        expected_hash = hash(
-            json.dumps(
-                {
-                    "fields": [{"name": "field1", "kind": "physical", "type": "STRING"}],
-                    "watermarks": [{"name": "wm1", "expression": "expr1"}],
-                    "constraints": {"primary_key": ["field1"]},
-                }
-            )
+class TestSchemaV2:
+    def test_from_json_components(self):
+        schema = SchemaV2.from_json_components(
+            SCHEMA_JSON["fields"],
+            SCHEMA_JSON["watermarks"],
+            SCHEMA_JSON["constraints"]["primary_key"],
         )
-        self.assertEqual(hash(schema), expected_hash)
+        assert len(schema.fields) == 1
+        assert schema.fields[0].name == "field1"
+        assert len(schema.watermarks) == 1
+        assert schema.watermarks[0].name == "wm1"
+        assert schema.constraints.primary_key == ["field1"]
 
+    def test_from_json(self):
+        schema = SchemaV2.from_json(SCHEMA_JSON)
+        assert len(schema.fields) == 1
+        assert schema.fields[0].name == "field1"
+        assert len(schema.watermarks) == 1
+        assert schema.watermarks[0].name == "wm1"
+        assert schema.constraints.primary_key == ["field1"]
+
+    def test_to_dict(self, schema: SchemaV2):
+        assert schema.to_dict() == SCHEMA_JSON
+
+    def test_eq(self, schema: SchemaV2):
+        other = SchemaV2(
+            fields=SCHEMA_FIELDS, watermarks=SCHEMA_WATERMARKS, constraints=SCHEMA_CONSTRAINTS
+        )
+        assert schema == other
 
-class TestSchemaFieldFactory(unittest.TestCase):
-    def test_schema_field_factory_physical(self):
-        field_dict = {"name": "field1", "kind": "physical", "type": "STRING"}
-        field = schema_field_factory(field_dict)
-        assert type(field) is PhysicalSchemaField
-        self.assertEqual(field.name, "field1")
-        self.assertEqual(field.type, String())
-        self.assertEqual(field.kind, FieldKind.physical)
+    def test_hash(self, schema: SchemaV2):
+        assert hash(schema) == hash(SchemaV2.from_json(SCHEMA_JSON))
 
-    def test_schema_field_factory_metadata(self):
-        field_dict = {"name": "field1", "kind": "metadata", "key": "key1", "type": "STRING"}
-        field = schema_field_factory(field_dict)
-        assert type(field) is MetadataSchemaField
-        self.assertEqual(field.name, "field1")
-        self.assertEqual(field.key, "key1")
-        self.assertEqual(field.type, String())
-        self.assertEqual(field.kind, FieldKind.metadata)
-
-    def test_schema_field_factory_computed(self):
-        field_dict = {"name": "field1", "kind": "computed", "expression": "expr1"}
+    def test_not_eq(self, schema: SchemaV2):
+        other = SchemaV2(
+            fields=[PhysicalSchemaField(name="field1", type=INT_TYPE)],
+            watermarks=SCHEMA_WATERMARKS,
+            constraints=SCHEMA_CONSTRAINTS,
+        )
+        assert schema != other
+
+
+class TestSchemaFieldFactory:
+    @pytest.mark.parametrize(
+        "field_dict,expected_cls,expected_attrs",
+        [
+            (
+                {"name": "field1", "kind": "physical", "type": "STRING"},
+                PhysicalSchemaField,
+                {"name": "field1", "type": STRING_TYPE, "kind": FieldKind.physical},
+            ),
+            (
+                {"name": "field1", "kind": "metadata", "key": "key1", "type": "STRING"},
+                MetadataSchemaField,
+                {"name": "field1", "key": "key1", "type": STRING_TYPE, "kind": FieldKind.metadata},
+            ),
+            (
+                {"name": "field1", "kind": "computed", "expression": "expr1"},
+                ComputedSchemaField,
+                {"name": "field1", "expression": "expr1", "kind": FieldKind.computed},
+            ),
+        ],
+    )
+    def test_schema_field_factory(
+        self,
+        field_dict: Dict[str, str],
+        expected_cls: Type[SchemaField],
+        expected_attrs: Dict[str, Any],
+    ):
         field = schema_field_factory(field_dict)
-        assert type(field) is ComputedSchemaField
-        self.assertEqual(field.name, "field1")
-        self.assertEqual(field.expression, "expr1")
-        self.assertEqual(field.kind, FieldKind.computed)
-
-
-if __name__ == "__main__":
-    unittest.main()
+        assert type(field) is expected_cls
+        for attr, value in expected_attrs.items():
+            assert getattr(field, attr) == value
+
+    def test_schema_field_factory_unknown_kind(self):
+        field_dict = {"name": "field1", "kind": "virtual"}
+        with pytest.raises(ValueError) as context:
+            schema_field_factory(field_dict)
+        assert "Unknown field kind: virtual" in str(context.value)
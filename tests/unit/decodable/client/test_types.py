@@ -14,39 +14,64 @@
 #  limitations under the License.
 #
 
-from decodable.client import types
-
-
-class TestTypes:
-    def test_concrete_type_from_str(self):
-        t = types.Char.from_str("CHAR(15)")
-        assert t == types.Char(15)
-
-        t = types.Char.from_str("CHAR()")
-        assert t is None
+import itertools
+from typing import List, Optional, Tuple, Type
 
-        t = types.Char.from_str("Char(10)")
-        assert t is None
+import pytest
 
-        t = types.Timestamp.from_str("TIMESTAMP(15) WITH TIME ZONE")
-        assert t == types.Timestamp(precision=15, timezone=True)
-
-        t = types.TimestampLocal.from_str("TIMESTAMP(3) WITH LOCAL TIME ZONE")
-        assert t == types.TimestampLocal(precision=3)
+from decodable.client import types
 
-    def test_from_str_dispatch(self):
-        str_types = ["DECIMAL", "STRING", "ARRAY<CHAR(1)>", "VARBINAR", "TIMESTAMP(3)"]
 
-        expected = [
-            types.Decimal(),
-            types.String(),
-            types.Array(types.Char(1)),
-            None,
-            types.Timestamp(precision=3, timezone=False),
-        ]
+class TestTypes:
+    @pytest.mark.parametrize(
+        "cls,s,expected",
+        [
+            (types.Char, "CHAR(15)", types.Char(15)),
+            (types.Char, "CHAR()", None),
+            (types.Char, "Char(10)", None),
+            (
+                types.Timestamp,
+                "TIMESTAMP(15) WITH TIME ZONE",
+                types.Timestamp(precision=15, timezone=True),
+            ),
+            (
+                types.TimestampLocal,
+                "TIMESTAMP(3) WITH LOCAL TIME ZONE",
+                types.TimestampLocal(precision=3),
+            ),
+        ],
+    )
+    def test_concrete_type_from_str(
+        self, cls: Type[types.FieldType], s: str, expected: Optional[types.FieldType]
+    ):
+        assert cls.from_str(s) == expected
+
+    @pytest.mark.parametrize(
+        "s,expected",
+        [
+            ("DECIMAL", types.Decimal()),
+            ("STRING", types.String()),
+            ("ARRAY<CHAR(1)>", types.Array(types.Char(1))),
+            ("VARBINAR", None),
+            ("TIMESTAMP(3)", types.Timestamp(precision=3, timezone=False)),
+        ],
+    )
+    def test_from_str_dispatch(self, s: str, expected: Optional[types.FieldType]):
+        assert types.FieldType.from_str(s) == expected
+
+    def test_map_from_str(self):
+        assert types.FieldType.from_str("MAP<STRING, DECIMAL(10, 2)>") == types.Map(
+            types.String(), types.Decimal(10, 2)
+        )
+        assert types.FieldType.from_str("MAP<MAP<INT, INT>, INT>") == types.Map(
+            types.Map(types.Int(), types.Int()), types.Int()
+        )
+        assert types.FieldType.from_str("MAP<INT, INT, INT>") is None
 
-        for a, b in zip(str_types, expected):
-            assert types.FieldType.from_str(a) == b
+    def test_from_str_memoized(self):
+        assert types.FieldType.from_str("DECIMAL(10, 2)") is types.FieldType.from_str(
+            "DECIMAL(10, 2)"
+        )
 
     def test_from_str_defaults(self):
         a = types.FieldType.from_str("DECIMAL")
@@ -57,24 +82,88 @@ class TestTypes:
         assert b == c
         assert c == a
 
-    def test_synonyms_equality(self):
-        assert types.Decimal() == types.Dec()
-        assert types.Numeric(15, 3) == types.Decimal(15, 3)
-        assert types.Decimal(5, 1) != types.Numeric(3, 1)
-
-        assert types.Varbinary(types.Bytes.length) == types.Bytes()
-        assert types.Varbinary(100) != types.Bytes()
-
-        assert types.Array(types.Decimal()) == types.TArray(types.Decimal())
-        assert types.Array(types.Decimal()) != types.TArray(types.String())
-        assert types.Array(types.Decimal()) == types.Array(types.Numeric())
-        assert types.Array(types.Decimal()) == types.TArray(types.Numeric())
+    @pytest.mark.parametrize(
+        "pairs",
+        [
+            pytest.param(
+                [
+                    (types.Decimal(), types.Dec(), True),
+                    (types.Numeric(15, 3), types.Decimal(15, 3), True),
+                    (types.Decimal(5, 1), types.Numeric(3, 1), False),
+                ],
+                id="exact_numeric",
+            ),
+            pytest.param(
+                [
+                    (types.Varbinary(types.Bytes.length), types.Bytes(), True),
+                    (types.Varbinary(100), types.Bytes(), False),
+                ],
+                id="binary",
+            ),
+            pytest.param(
+                [
+                    (types.Array(types.Decimal()), types.TArray(types.Decimal()), True),
+                    (types.Array(types.Decimal()), types.TArray(types.String()), False),
+                    (types.Array(types.Decimal()), types.Array(types.Numeric()), True),
+                    (types.Array(types.Decimal()), types.TArray(types.Numeric()), True),
+                ],
+                id="array",
+            ),
+            pytest.param(
+                [
+                    (types.NotNull(types.Decimal()), types.NotNull(types.Numeric()), True),
+                    (
+                        types.NotNull(types.Array(types.Dec())),
+                        types.NotNull(types.TArray(types.Decimal())),
+                        True,
+                    ),
+                    (
+                        types.NotNull(types.Array(types.String())),
+                        types.NotNull(types.Array(types.Boolean())),
+                        False,
+                    ),
+                    (types.NotNull(types.Array(types.Bytes())), types.Bytes(), False),
+                ],
+                id="not_null",
+            ),
+        ],
+    )
+    def test_synonyms_equality(self, pairs: List[Tuple[types.FieldType, types.FieldType, bool]]):
+        for a, b, equal in pairs:
+            assert (a == b) is equal
+
+    def test_wrapped_synonyms_hash(self):
+        wrapped = [
+            wrapper(compound)
+            for wrapper in (types.NotNull, types.PrimaryKey)
+            for compound in (
+                types.Array(types.Int()),
+                types.TArray(types.Int()),
+                types.Map(types.String(), types.Array(types.Int())),
+                types.Map(types.String(), types.TArray(types.Int())),
+            )
+        ]
 
-        assert types.NotNull(types.Decimal()) == types.NotNull(types.Numeric())
-        assert types.NotNull(types.Array(types.Dec())) == types.NotNull(
-            types.TArray(types.Decimal())
-        )
-        assert types.NotNull(types.Array(types.String())) != types.NotNull(
-            types.Array(types.Boolean())
-        )
-        assert types.NotNull(types.Array(types.Bytes())) != types.Bytes()
+        for a, b in itertools.product(wrapped, wrapped):
+            if a == b:
+                assert hash(a) == hash(b), f"{a} == {b}"
+
+    def test_compound_hash(self):
+        assert hash(types.Array(types.Int())) == hash(types.TArray(types.Int()))
+        assert len({types.Array(types.Int()), types.TArray(types.Int())}) == 1
+
+        not_null_array = types.NotNull(types.Array(types.Int()))
+        not_null_tarray = types.NotNull(types.TArray(types.Int()))
+        assert not_null_array == not_null_tarray
+        assert hash(not_null_array) == hash(not_null_tarray)
+        assert len({not_null_array, not_null_tarray}) == 1
+
+        pk_map_array = types.PrimaryKey(types.Map(types.Int(), types.Array(types.String())))
+        pk_map_tarray = types.PrimaryKey(types.Map(types.Int(), types.TArray(types.String())))
+        assert pk_map_array == pk_map_tarray
+        assert hash(pk_map_array) == hash(pk_map_tarray)
+        assert len({pk_map_array, pk_map_tarray}) == 1
+
+    def test_synonyms_shared(self):
+        assert types.Decimal(15, 3).synonyms is types.Decimal(15, 3).synonyms
+        assert types.Dec(is_synonym=True).synonyms == frozenset()
@@ -0,0 +1,29 @@
+#
+#  Copyright 2023 decodable Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+
+import os
+
+import pytest
+
+from decodable.config.profile import DecodableAccessTokens
+from decodable.config.profile_reader import DecodableProfileReader
+
+
+# Parsed once and shared, since tests only read from it
+@pytest.fixture(scope="session")  # pyright: ignore [reportUntypedFunctionDecorator]
+def loaded_profile() -> DecodableAccessTokens:
+    return DecodableProfileReader.load_profiles(f"{os.path.dirname(__file__)}/test_profile.yml")
@@ -14,6 +14,7 @@
 #  limitations under the License.
 #
 import os
+from pathlib import Path
 from unittest import mock
 from decodable.config.profile import DecodableAccessTokens
 from decodable.config.profile_reader import DecodableProfileReader, PROFILE_ENV_VARIABLE_NAME
@@ -32,8 +33,18 @@ class TestProfileAdapter:
 
     """Test loading default profile"""
 
-    def test_load_default_profile(self):
-        test_profile: DecodableAccessTokens = DecodableProfileReader.load_profiles(
-            f"{os.path.dirname(__file__)}/test_profile.yml"
-        )
-        assert test_profile.profile_tokens[TEST_PROFILE_NAME] == TEST_PROFILE_ACCESS_TOKEN
+    def test_load_default_profile(self, loaded_profile: DecodableAccessTokens):
+        assert loaded_profile.profile_tokens[TEST_PROFILE_NAME] == TEST_PROFILE_ACCESS_TOKEN
+
+    """Test reloading a profile file after it changes"""
+
+    def test_load_profiles_picks_up_changes(self, tmp_path: Path):
+        profile_path = tmp_path / "auth"
+        profile_path.write_text("tokens:\n    default:\n        access_token: first\n")
+        first = DecodableProfileReader.load_profiles(str(profile_path))
+        assert DecodableProfileReader.load_profiles(str(profile_path)) is first
+
+        profile_path.write_text("tokens:\n    default:\n        access_token: second\n")
+        os.utime(profile_path, ns=(0, profile_path.stat().st_mtime_ns + 10**9))
+        reloaded = DecodableProfileReader.load_profiles(str(profile_path))
+        assert reloaded.profile_tokens[TEST_PROFILE_NAME] == "second"